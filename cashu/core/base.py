@@ -17,6 +17,7 @@ from .crypto.keys import (
     derive_keyset_id,
     derive_keyset_id_deprecated,
     derive_pubkeys,
+    pubkey_from_hex,
 )
 from .crypto.secp import PrivateKey, PublicKey
 from .legacy import derive_keys_backwards_compatible_insecure_pre_0_12
@@ -459,7 +460,7 @@ class WalletKeyset:
     def from_row(cls, row: Row):
         def deserialize(serialized: str) -> Dict[int, PublicKey]:
             return {
-                int(amount): PublicKey(bytes.fromhex(hex_key), raw=True)
+                int(amount): pubkey_from_hex(hex_key)
                 for amount, hex_key in dict(json.loads(serialized)).items()
             }
 
@@ -51,13 +51,17 @@ If true, a in A = a*G must be equal to a in C' = a*B'
 """
 
 import hashlib
+from functools import lru_cache
 from typing import Optional, Tuple
 
 from secp256k1 import PrivateKey, PublicKey
 
 DOMAIN_SEPARATOR = b"Secp256k1_HashToCurve_Cashu_"
+# order n of the secp256k1 group
+SECP256K1_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
 
 
+@lru_cache(maxsize=8192)
 def hash_to_curve(message: bytes) -> PublicKey:
     """Generates a secp256k1 point from a message.
 
@@ -71,6 +75,10 @@ def hash_to_curve(message: bytes) -> PublicKey:
 
     The domain separator is b"Secp256k1_HashToCurve_Cashu_" or
     bytes.fromhex("536563703235366b315f48617368546f43757276655f43617368755f").
+
+    Results are cached because the same secret is usually mapped several times (when
+    blinding it, when constructing the Proof, and when verifying it). The returned
+    point is shared between callers and must not be modified in place.
     """
     msg_to_hash = hashlib.sha256(DOMAIN_SEPARATOR + message).digest()
     counter = 0
@@ -85,6 +93,13 @@ def hash_to_curve(message: bytes) -> PublicKey:
     raise ValueError("No valid point found")
 
 
+def negate_scalar(k: PrivateKey) -> bytes:
+    """Returns -k mod n. Multiplying a point with -k and adding the result is cheaper
+    than multiplying with k and negating the point, which round-trips it through its
+    serialization."""
+    return (SECP256K1_ORDER - int.from_bytes(k.private_key, "big")).to_bytes(32, "big")
+
+
 def step1_alice(
     secret_msg: str, blinding_factor: Optional[PrivateKey] = None
 ) -> tuple[PublicKey, PrivateKey]:
@@ -102,7 +117,7 @@ def step2_bob(B_: PublicKey, a: PrivateKey) -> Tuple[PublicKey, PrivateKey, Priv
 
 
 def step3_alice(C_: PublicKey, r: PrivateKey, A: PublicKey) -> PublicKey:
-    C: PublicKey = C_ - A.mult(r)  # type: ignore
+    C: PublicKey = C_ + A.tweak_mul(negate_scalar(r))  # C = C_ - rA # type: ignore
     return C
 
 
@@ -151,8 +166,9 @@ def step2_bob_dleq(
 def alice_verify_dleq(
     B_: PublicKey, C_: PublicKey, e: PrivateKey, s: PrivateKey, A: PublicKey
 ) -> bool:
-    R1 = s.pubkey - A.mult(e)  # type: ignore
-    R2 = B_.mult(s) - C_.mult(e)  # type: ignore
+    minus_e = negate_scalar(e)
+    R1 = s.pubkey + A.tweak_mul(minus_e)  # R1 = sG - eA # type: ignore
+    R2 = B_.mult(s) + C_.tweak_mul(minus_e)  # R2 = sB_ - eC_ # type: ignore
     e_bytes = e.private_key
     return e_bytes == hash_e(R1, R2, A, C_)
 
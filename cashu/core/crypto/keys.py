@@ -1,6 +1,7 @@
 import base64
 import hashlib
 import random
+from functools import lru_cache
 from typing import Dict
 
 from bip32 import BIP32
@@ -47,6 +48,13 @@ def derive_pubkey(seed: str):
     ).pubkey
 
 
+@lru_cache(maxsize=4096)
+def pubkey_from_hex(hex_key: str) -> PublicKey:
+    """Deserializes a hex-encoded public key. Results are cached since the public
+    keys of a keyset are parsed again every time the keyset is loaded."""
+    return PublicKey(bytes.fromhex(hex_key), raw=True)
+
+
 def derive_pubkeys(keys: Dict[int, PrivateKey]):
     return {amt: keys[amt].pubkey for amt in [2**i for i in range(settings.max_order)]}
 
@@ -19,11 +19,11 @@ def amount_summary(proofs: List[Proof], unit: Unit) -> str:
 
 
 def sum_proofs(proofs: List[Proof]):
-    return sum([p.amount for p in proofs])
+    return sum(p.amount for p in proofs)
 
 
 def sum_promises(promises: List[BlindedSignature]):
-    return sum([p.amount for p in promises])
+    return sum(p.amount for p in promises)
 
 
 def async_wrap(func):
@@ -76,6 +76,11 @@ async def start_wallet():
         raise Exception("tor not working.")
 
 
+@router.on_event("shutdown")
+async def stop_wallet():
+    await wallet.close()
+
+
 @router.post(
     "/lightning/pay_invoice",
     name="Pay lightning invoice",
@@ -1,6 +1,6 @@
 import json
 import time
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Set, Tuple
 
 from ..core.base import Invoice, Proof, WalletKeyset
 from ..core.db import Connection, Database
@@ -149,19 +149,24 @@ async def update_proof(
     )
 
 
-async def secret_used(
-    secret: str,
+async def secrets_used(
+    secrets: List[str],
     db: Database,
     conn: Optional[Connection] = None,
-) -> bool:
-    rows = await (conn or db).fetchone(
-        """
-        SELECT * from proofs
-        WHERE secret = ?
-        """,
-        (secret,),
-    )
-    return rows is not None
+) -> Set[str]:
+    used: Set[str] = set()
+    # SQLite allows at most 999 parameters per query
+    for i in range(0, len(secrets), 999):
+        chunk = secrets[i : i + 999]
+        rows = await (conn or db).fetchall(
+            f"""
+            SELECT secret from proofs
+            WHERE secret IN ({','.join(['?']*len(chunk))})
+            """,
+            tuple(chunk),
+        )
+        used.update(r[0] for r in rows)
+    return used
 
 
 async def store_keyset(
@@ -74,7 +74,8 @@ class WalletProofs(SupportsDb, SupportsKeysets):
         return keysets
 
     async def _get_keyset_urls(self, keysets: List[str]) -> Dict[str, List[str]]:
-        """Retrieves the mint URLs for a list of keyset id's from the wallet's database.
+        """Retrieves the mint URLs for a list of keyset id's from the wallet's keysets
+        in memory, or from the database if they are not loaded.
         Returns a dictionary from URL to keyset ID
 
         Args:
@@ -82,8 +83,10 @@ class WalletProofs(SupportsDb, SupportsKeysets):
         """
         mint_urls: Dict[str, List[str]] = {}
         for ks in set(keysets):
-            keysets_db = await get_keysets(id=ks, db=self.db)
-            keyset_db = keysets_db[0] if keysets_db else None
+            keyset_db = self.keysets.get(ks)
+            if not keyset_db or not keyset_db.mint_url:
+                keysets_db = await get_keysets(id=ks, db=self.db)
+                keyset_db = keysets_db[0] if keysets_db else None
             if keyset_db and keyset_db.mint_url:
                 mint_urls[keyset_db.mint_url] = (
                     mint_urls[keyset_db.mint_url] + [ks]
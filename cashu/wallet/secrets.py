@@ -1,5 +1,4 @@
 import base64
-import hashlib
 import os
 from typing import List, Optional, Tuple
 
@@ -102,7 +101,7 @@ class WalletSecrets(SupportsDb, SupportsKeysets):
         We won't be able to restore any ecash generated with these secrets.
         """
         # return random 32 byte hex string
-        return hashlib.sha256(os.urandom(32)).hexdigest()
+        return os.urandom(32).hex()
 
     async def generate_determinstic_secret(
         self, counter: int
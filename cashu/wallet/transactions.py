@@ -205,7 +205,10 @@ class WalletTransactions(SupportsDb, SupportsKeysets):
             proofs (List[Proof]): List of proofs to mark as reserved
             reserved (bool): Whether to mark the proofs as reserved or not
         """
-        uuid_str = str(uuid.uuid1())
-        for proof in proofs:
-            proof.reserved = True
-            await update_proof(proof, reserved=reserved, send_id=uuid_str, db=self.db)
+        uuid_str = str(uuid.uuid4())
+        async with self.db.connect() as conn:
+            for proof in proofs:
+                proof.reserved = True
+                await update_proof(
+                    proof, reserved=reserved, send_id=uuid_str, conn=conn
+                )
@@ -1,5 +1,7 @@
+import asyncio
 import json
 import uuid
+from importlib.util import find_spec
 from posixpath import join
 from typing import List, Optional, Tuple, Union
 
@@ -17,7 +19,7 @@ from ..core.base import (
     Unit,
     WalletKeyset,
 )
-from ..core.crypto.secp import PublicKey
+from ..core.crypto.keys import pubkey_from_hex
 from ..core.db import Database
 from ..core.models import (
     CheckFeesResponse_deprecated,
@@ -54,7 +56,8 @@ def async_set_httpx_client(func):
     """
     Decorator that wraps around any async class method of LedgerAPI that makes
     API calls. Sets some HTTP headers and starts a Tor instance if none is
-    already running and and sets local proxy to use it.
+    already running and and sets local proxy to use it. The client is kept on the
+    instance and reused by subsequent calls to keep connections to the mint alive.
     """
 
     async def wrapper(self, *args, **kwargs):
@@ -74,13 +77,25 @@ def async_set_httpx_client(func):
 
         headers_dict = {"Client-version": settings.version}
 
-        self.httpx = httpx.AsyncClient(
-            verify=not settings.debug,
-            proxies=proxies_dict,  # type: ignore
-            headers=headers_dict,
-            base_url=self.url,
-            timeout=None if settings.debug else 60,
-        )
+        # reuse the client (and its pooled connections) unless it was closed or
+        # created for a different mint, proxy, or event loop
+        client_key = (self.url, proxy_url, asyncio.get_running_loop())
+        if (
+            getattr(self, "httpx", None) is None
+            or self.httpx.is_closed
+            or getattr(self, "httpx_client_key", None) != client_key
+        ):
+            self.httpx = httpx.AsyncClient(
+                verify=not settings.debug,
+                proxies=proxies_dict,  # type: ignore
+                headers=headers_dict,
+                base_url=self.url,
+                timeout=None if settings.debug else httpx.Timeout(60, connect=10),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=10),
+                # multiplex requests over one connection if httpx[http2] is installed
+                http2=find_spec("h2") is not None,
+            )
+            self.httpx_client_key = client_key
         return await func(self, *args, **kwargs)
 
     return wrapper
@@ -113,6 +128,11 @@ class LedgerAPI(LedgerAPIDeprecated, object):
         """Dummy function that can be called from outside to use LedgerAPI.s"""
         return
 
+    async def close(self) -> None:
+        """Closes the HTTP client and its pooled connections to the mint."""
+        if getattr(self, "httpx", None) is not None and not self.httpx.is_closed:
+            await self.httpx.aclose()
+
     @staticmethod
     def raise_on_error_request(
         resp: Response,
@@ -125,6 +145,10 @@ class LedgerAPI(LedgerAPIDeprecated, object):
         Raises:
             Exception: if the response contains an error
         """
+        # errors are returned with a non-2xx status code. Don't decode successful
+        # responses here, the caller parses them anyway.
+        if resp.is_success:
+            return
         try:
             resp_dict = resp.json()
         except json.JSONDecodeError:
@@ -179,8 +203,7 @@ class LedgerAPI(LedgerAPIDeprecated, object):
                 id=keyset.id,
                 unit=keyset.unit,
                 public_keys={
-                    int(amt): PublicKey(bytes.fromhex(val), raw=True)
-                    for amt, val in keyset.keys.items()
+                    int(amt): pubkey_from_hex(val) for amt, val in keyset.keys.items()
                 },
                 mint_url=self.url,
             )
@@ -219,8 +242,7 @@ class LedgerAPI(LedgerAPIDeprecated, object):
         keys = KeysResponse.parse_obj(keys_dict)
         this_keyset = keys.keysets[0]
         keyset_keys = {
-            int(amt): PublicKey(bytes.fromhex(val), raw=True)
-            for amt, val in this_keyset.keys.items()
+            int(amt): pubkey_from_hex(val) for amt, val in this_keyset.keys.items()
         }
         keyset = WalletKeyset(
             id=keyset_id,
@@ -483,7 +505,7 @@ class LedgerAPI(LedgerAPIDeprecated, object):
         self.raise_on_error_request(resp)
         promises_dict = resp.json()
         mint_response = PostSplitResponse.parse_obj(promises_dict)
-        promises = [BlindedSignature(**p.dict()) for p in mint_response.signatures]
+        promises = mint_response.signatures
 
         if len(promises) == 0:
             raise Exception("received no splits.")
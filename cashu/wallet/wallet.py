@@ -1,5 +1,7 @@
+import asyncio
 import copy
 import time
+from collections import Counter
 from typing import Dict, List, Optional, Tuple, Union
 
 import bolt11
@@ -35,7 +37,7 @@ from ..wallet.crud import (
     get_keysets,
     get_proofs,
     invalidate_proof,
-    secret_used,
+    secrets_used,
     set_secret_derivation,
     store_keyset,
     store_lightning_invoice,
@@ -186,15 +188,20 @@ class Wallet(
         keysets_in_db_dict = {k.id: k for k in keysets_in_db}
 
         # get all new keysets that are not in memory yet and store them in the database
-        for mint_keyset in mint_keysets_dict.values():
-            if mint_keyset.id not in keysets_in_db_dict:
-                logger.debug(
-                    f"Storing new mint keyset: {mint_keyset.id} ({mint_keyset.unit})"
-                )
-                wallet_keyset = await self._get_keyset(mint_keyset.id)
-                wallet_keyset.active = mint_keyset.active
-                wallet_keyset.input_fee_ppk = mint_keyset.input_fee_ppk or 0
-                await store_keyset(keyset=wallet_keyset, db=self.db)
+        new_mint_keysets = [
+            k for k in mint_keysets_dict.values() if k.id not in keysets_in_db_dict
+        ]
+        # fetch the keys of all new keysets concurrently
+        new_wallet_keysets = await asyncio.gather(
+            *[self._get_keyset(k.id) for k in new_mint_keysets]
+        )
+        for mint_keyset, wallet_keyset in zip(new_mint_keysets, new_wallet_keysets):
+            logger.debug(
+                f"Storing new mint keyset: {mint_keyset.id} ({mint_keyset.unit})"
+            )
+            wallet_keyset.active = mint_keyset.active
+            wallet_keyset.input_fee_ppk = mint_keyset.input_fee_ppk or 0
+            await store_keyset(keyset=wallet_keyset, db=self.db)
 
         for mint_keyset in mint_keysets_dict.values():
             # if the active or the fee attributes have changed, update them in the database
@@ -307,9 +314,10 @@ class Wallet(
     async def _check_used_secrets(self, secrets):
         """Checks if any of the secrets have already been used"""
         logger.trace("Checking secrets.")
-        for s in secrets:
-            if await secret_used(s, db=self.db):
-                raise Exception(f"secret already used: {s}")
+        used_secrets = await secrets_used(secrets, db=self.db)
+        if used_secrets:
+            s = next(s for s in secrets if s in used_secrets)
+            raise Exception(f"secret already used: {s}")
         logger.trace("Secret check complete.")
 
     async def request_mint(self, amount: int) -> Invoice:
@@ -319,20 +327,9 @@ class Wallet(
             amount (int): Amount for Lightning invoice in satoshis
 
         Returns:
-            PostMintQuoteResponse: Mint Quote Response
+            Invoice: Lightning invoice for minting tokens
         """
-        mint_quote_response = await super().mint_quote(amount, self.unit)
-        decoded_invoice = bolt11.decode(mint_quote_response.request)
-        invoice = Invoice(
-            amount=amount,
-            bolt11=mint_quote_response.request,
-            payment_hash=decoded_invoice.payment_hash,
-            id=mint_quote_response.quote,
-            out=False,
-            time_created=int(time.time()),
-        )
-        await store_lightning_invoice(db=self.db, invoice=invoice)
-        return invoice
+        return await self.mint_quote(amount)
 
     def split_wallet_state(self, amount: int) -> List[int]:
         """This function produces an amount split for outputs based on the current state of the wallet.
@@ -346,29 +343,29 @@ class Wallet(
         """
         # read the target count for each amount from settings
         n_target = settings.wallet_target_amount_count
-        amounts_we_have = [p.amount for p in self.proofs if p.reserved is not True]
-        amounts_we_have.sort()
+        amounts_we_have = Counter(
+            p.amount for p in self.proofs if p.reserved is not True
+        )
         # NOTE: Do not assume 2^n here
         all_possible_amounts: list[int] = [2**i for i in range(settings.max_order)]
         amounts_we_want_ll = [
-            [a] * max(0, n_target - amounts_we_have.count(a))
-            for a in all_possible_amounts
+            [a] * max(0, n_target - amounts_we_have[a]) for a in all_possible_amounts
         ]
         # flatten list of lists to list
         amounts_we_want = [item for sublist in amounts_we_want_ll for item in sublist]
         # sort by increasing amount
         amounts_we_want.sort()
 
-        logger.debug(
-            f"Amounts we have: {[(a, amounts_we_have.count(a)) for a in set(amounts_we_have)]}"
-        )
+        logger.debug(f"Amounts we have: {sorted(amounts_we_have.items())}")
         amounts: list[int] = []
-        while sum(amounts) < amount and amounts_we_want:
-            if sum(amounts) + amounts_we_want[0] > amount:
+        amounts_sum = 0
+        for a in amounts_we_want:
+            if amounts_sum + a > amount:
                 break
-            amounts.append(amounts_we_want.pop(0))
+            amounts.append(a)
+            amounts_sum += a
 
-        remaining_amount = amount - sum(amounts)
+        remaining_amount = amount - amounts_sum
         if remaining_amount > 0:
             amounts += amount_split(remaining_amount)
 
@@ -746,15 +743,6 @@ class Wallet(
                 C_, r, self.keysets[promise.id].public_keys[promise.amount]
             )
 
-            if not settings.wallet_use_deprecated_h2c:
-                B_, r = b_dhke.step1_alice(secret, r)  # recompute B_ for dleq proofs
-            # BEGIN: BACKWARDS COMPATIBILITY < 0.15.1
-            else:
-                B_, r = b_dhke.step1_alice_deprecated(
-                    secret, r
-                )  # recompute B_ for dleq proofs
-            # END: BACKWARDS COMPATIBILITY < 0.15.1
-
             proof = Proof(
                 id=promise.id,
                 amount=promise.amount,
@@ -885,11 +873,9 @@ class Wallet(
             for p in invalidated_proofs:
                 await invalidate_proof(p, db=self.db, conn=conn)
 
-        invalidate_secrets = [p.secret for p in invalidated_proofs]
-        self.proofs = list(
-            filter(lambda p: p.secret not in invalidate_secrets, self.proofs)
-        )
-        return [p for p in proofs if p not in invalidated_proofs]
+        invalidate_secrets = {p.secret for p in invalidated_proofs}
+        self.proofs = [p for p in self.proofs if p.secret not in invalidate_secrets]
+        return [p for p in proofs if p.secret not in invalidate_secrets]
 
     # ---------- TRANSACTION HELPERS ----------
 
@@ -986,10 +972,13 @@ class Wallet(
             proofs, amount, include_fees=True
         )
         # add proofs from inactive keysets to swap_proofs to get rid of them
+        swap_secrets = {p.secret for p in swap_proofs}
         swap_proofs += [
             p
             for p in proofs
-            if not self.keysets[p.id].active and not p.reserved and p not in swap_proofs
+            if not self.keysets[p.id].active
+            and not p.reserved
+            and p.secret not in swap_secrets
         ]
 
         fees = self.get_fees_for_proofs(swap_proofs)
@@ -1009,12 +998,12 @@ class Wallet(
 
     @property
     def available_balance(self):
-        return sum_proofs([p for p in self.proofs if not p.reserved])
+        return sum(p.amount for p in self.proofs if not p.reserved)
 
     @property
     def proof_amounts(self):
         """Returns a sorted list of amounts of all proofs"""
-        return [p.amount for p in sorted(self.proofs, key=lambda p: p.amount)]
+        return sorted(p.amount for p in self.proofs)
 
     def active_proofs(self, proofs: List[Proof]):
         """Returns a list of proofs that
@@ -1190,10 +1179,9 @@ class Wallet(
         # restored_outputs is there so we can match the promises to the secrets and rs
         restored_outputs, restored_promises = await super().restore_promises(outputs)
         # now we need to filter out the secrets and rs that had a match
+        restored_B_s = {o.B_ for o in restored_outputs}
         matching_indices = [
-            idx
-            for idx, val in enumerate(outputs)
-            if val.B_ in [o.B_ for o in restored_outputs]
+            idx for idx, val in enumerate(outputs) if val.B_ in restored_B_s
         ]
         secrets = [secrets[i] for i in matching_indices]
         rs = [rs[i] for i in matching_indices]
@@ -1,3 +1,5 @@
+import asyncio
+from importlib.util import find_spec
 from posixpath import join
 from typing import List, Optional, Tuple, Union
 
@@ -13,7 +15,7 @@ from ..core.base import (
     Proof,
     WalletKeyset,
 )
-from ..core.crypto.secp import PublicKey
+from ..core.crypto.keys import pubkey_from_hex
 from ..core.models import (
     CheckFeesRequest_deprecated,
     CheckFeesResponse_deprecated,
@@ -42,7 +44,8 @@ def async_set_httpx_client(func):
     """
     Decorator that wraps around any async class method of LedgerAPI that makes
     API calls. Sets some HTTP headers and starts a Tor instance if none is
-    already running and and sets local proxy to use it.
+    already running and and sets local proxy to use it. The client is kept on the
+    instance and reused by subsequent calls to keep connections to the mint alive.
     """
 
     async def wrapper(self, *args, **kwargs):
@@ -62,13 +65,25 @@ def async_set_httpx_client(func):
 
         headers_dict = {"Client-version": settings.version}
 
-        self.httpx = httpx.AsyncClient(
-            verify=not settings.debug,
-            proxies=proxies_dict,  # type: ignore
-            headers=headers_dict,
-            base_url=self.url,
-            timeout=None if settings.debug else 60,
-        )
+        # reuse the client (and its pooled connections) unless it was closed or
+        # created for a different mint, proxy, or event loop
+        client_key = (self.url, proxy_url, asyncio.get_running_loop())
+        if (
+            getattr(self, "httpx", None) is None
+            or self.httpx.is_closed
+            or getattr(self, "httpx_client_key", None) != client_key
+        ):
+            self.httpx = httpx.AsyncClient(
+                verify=not settings.debug,
+                proxies=proxies_dict,  # type: ignore
+                headers=headers_dict,
+                base_url=self.url,
+                timeout=None if settings.debug else httpx.Timeout(60, connect=10),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=10),
+                # multiplex requests over one connection if httpx[http2] is installed
+                http2=find_spec("h2") is not None,
+            )
+            self.httpx_client_key = client_key
         return await func(self, *args, **kwargs)
 
     return wrapper
@@ -105,6 +120,10 @@ class LedgerAPIDeprecated(SupportsHttpxClient, SupportsMintURL):
         Raises:
             Exception: if the response contains an error
         """
+        # errors are returned with a non-2xx status code. Don't decode successful
+        # responses here, the caller parses them anyway.
+        if resp.is_success:
+            return
         resp_dict = resp.json()
         if "detail" in resp_dict:
             logger.trace(f"Error from mint: {resp_dict}")
@@ -159,10 +178,7 @@ class LedgerAPIDeprecated(SupportsHttpxClient, SupportsMintURL):
         self.raise_on_error(resp)
         keys: dict = resp.json()
         assert len(keys), Exception("did not receive any keys")
-        keyset_keys = {
-            int(amt): PublicKey(bytes.fromhex(val), raw=True)
-            for amt, val in keys.items()
-        }
+        keyset_keys = {int(amt): pubkey_from_hex(val) for amt, val in keys.items()}
         keyset = WalletKeyset(unit="sat", public_keys=keyset_keys, mint_url=url)
         return keyset
 
@@ -189,10 +205,7 @@ class LedgerAPIDeprecated(SupportsHttpxClient, SupportsMintURL):
         self.raise_on_error(resp)
         keys = resp.json()
         assert len(keys), Exception("did not receive any keys")
-        keyset_keys = {
-            int(amt): PublicKey(bytes.fromhex(val), raw=True)
-            for amt, val in keys.items()
-        }
+        keyset_keys = {int(amt): pubkey_from_hex(val) for amt, val in keys.items()}
         keyset = WalletKeyset(
             unit="sat",
             id=keyset_id,
@@ -372,7 +385,7 @@ class LedgerAPIDeprecated(SupportsHttpxClient, SupportsMintURL):
         self.raise_on_error(resp)
         promises_dict = resp.json()
         mint_response = PostSplitResponse_Deprecated.parse_obj(promises_dict)
-        promises = [BlindedSignature(**p.dict()) for p in mint_response.promises]
+        promises = mint_response.promises
 
         if len(promises) == 0:
             raise Exception("received no splits.")
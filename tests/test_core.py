@@ -7,6 +7,8 @@ from cashu.core.split import amount_split
 
 def test_get_output_split():
     assert amount_split(13) == [1, 4, 8]
+    assert amount_split(0) == []
+    assert amount_split(2**20 + 3) == [1, 2, 2**20]
 
 
 def test_tokenv3_deserialize_get_attributes():
@@ -5,6 +5,7 @@ from cashu.core.crypto.b_dhke import (
     hash_e,
     hash_to_curve,
     hash_to_curve_deprecated,
+    negate_scalar,
     step1_alice,
     step1_alice_deprecated,
     step2_bob,
@@ -117,6 +118,13 @@ def test_step3():
     )
 
 
+def test_negate_scalar():
+    A = PrivateKey().pubkey
+    assert A
+    r = PrivateKey()
+    assert A.tweak_mul(negate_scalar(r)) == -A.mult(r)  # type: ignore
+
+
 def test_dleq_hash_e():
     C_ = PublicKey(
         bytes.fromhex(
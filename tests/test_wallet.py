@@ -174,6 +174,19 @@ async def test_mint(wallet1: Wallet):
     assert all([p.mint_id == invoice.id for p in proofs_minted])
 
 
+@pytest.mark.asyncio
+async def test_check_used_secrets(wallet1: Wallet):
+    invoice = await wallet1.request_mint(64)
+    pay_if_regtest(invoice.bolt11)
+    await wallet1.mint(64, id=invoice.id)
+    secrets = [p.secret for p in wallet1.proofs]
+    await wallet1._check_used_secrets(["unused_secret"])
+    await assert_err(
+        wallet1._check_used_secrets(["unused_secret"] + secrets),
+        f"secret already used: {secrets[0]}",
+    )
+
+
 @pytest.mark.asyncio
 async def test_mint_amounts(wallet1: Wallet):
     """Mint predefined amounts"""